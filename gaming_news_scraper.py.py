@@ -7,39 +7,73 @@ Obtiene noticias de Vandal, genera pies de foto, títulos, descripciones e imág
 Organiza el contenido en carpetas por fecha (YYYY-MM-DD) con subcarpetas por noticia.
 """
 
+import asyncio
 import json
 import logging
 import requests
 import random
 import time
 import hashlib
+import os
+import shutil
+import sys
+from array import array
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple, Set
+from typing import List, Dict, Optional, Any, Tuple, Set, Iterator, Callable
 from dataclasses import dataclass, asdict, field
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import re
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    BS4_FEATURES = "lxml"
+except ImportError:
+    BS4_FEATURES = "html.parser"
+
 # Configuración del logger global
 logger = logging.getLogger("gaming_news_scraper")
 
 # Configuración de constantes
 BASE_URL = "https://vandal.elespanol.com"
 NEWS_URL = f"{BASE_URL}/noticias/videojuegos"
-USER_AGENTS = [
+USER_AGENTS = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0'
-]
+)
+BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'es-ES,es;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Referer': 'https://www.google.com/',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+}
 OUTPUT_DIR = Path("gaming_news_output")
 CONTENT_DIR = OUTPUT_DIR / "contenido"
 LOGS_DIR = OUTPUT_DIR / "logs"
 LOG_SUBDIR = LOGS_DIR / "logs"
 DEBUG_SUBDIR = LOGS_DIR / "debug"
-HISTORY_FILE = OUTPUT_DIR / "news_history.json"
+HISTORY_FILE = OUTPUT_DIR / "news_history.bin"
+LEGACY_HISTORY_FILE = OUTPUT_DIR / "news_history.json"
 CONFIG = {
     "news_count": 5,  # Número de noticias a extraer
     "caption_max_length": 150,  # Longitud máxima del caption para TikTok
@@ -50,8 +84,32 @@ CONFIG = {
     "hashtags": ["Gaming", "Videojuegos", "Noticias", "Gamer", "PlayStation", "Xbox", "Nintendo", "PC"],
     "max_retries": 3,  # Número máximo de reintentos para obtener noticias
     "retry_delay": 5,  # Tiempo de espera entre reintentos (segundos)
-    "history_limit": 500  # Límite de noticias en el historial
+    "history_limit": 500,  # Límite de noticias en el historial
+    "max_concurrency": 4,  # Máximo de descargas simultáneas de artículos e imágenes
+    "debug_dump_html": False  # Guardar el HTML descargado en logs/debug (también con nivel DEBUG)
 }
+# Etiquetas que BeautifulSoup materializa al parsear listados, artículos y la portada
+LIST_STRAINER = SoupStrainer(['article', 'div', 'h1', 'h2', 'h3', 'a', 'p', 'img', 'figure', 'span', 'time'])
+ARTICLE_STRAINER = SoupStrainer(['div', 'article', 'h1', 'p', 'img', 'meta', 'figure', 'span', 'time'])
+HOMEPAGE_STRAINER = SoupStrainer('a')
+# Selectores por campo en orden de prioridad: se usa el primero que encuentra algo
+LIST_TITLE_SELECTORS = ('h2.titular a', 'h2 a', 'h1 a', 'h3 a', '.title a', 'a.title', 'a[title]')
+LIST_SUMMARY_SELECTORS = ('p.texto', 'p.description', '.summary', '.excerpt', 'p:not(.meta)', 'p')
+LIST_IMAGE_SELECTORS = ('img', '.image img', '.thumbnail img', 'figure img')
+LIST_AUTHOR_SELECTORS = ('.autor', '.author', '.meta .author', 'span.author')
+LIST_DATE_SELECTORS = ('.fecha', '.date', '.meta .date', 'time', 'span.date')
+# Enlaces a noticias de la portada (método de respaldo): el filtrado por URL lo hace el motor de selectores
+HOMEPAGE_NEWS_LINK_SELECTOR = 'a[href*="/noticia/"], a[href*="/noticias/"]'
+# Selectores de la página de la noticia en orden de prioridad; las etiquetas <meta> se consultan
+# solo si ninguno encuentra algo
+ARTICLE_SUMMARY_SELECTORS = ('div.entradilla', '.article-summary', '.summary', '.intro', '.excerpt')
+ARTICLE_IMAGE_SELECTORS = ('div.imagen img', '.article-featured-image img', '.featured-image img',
+                           'article img', '.content img')
+# Expresiones para generar nombres de archivo seguros a partir del título
+SLUG_RE = re.compile(r'[^\w\s-]')
+SPACES_RE = re.compile(r'\s+')
+# Separador de candidatos en srcset: coma tras un descriptor ("640w,") o seguida de espacio
+SRCSET_SPLIT_RE = re.compile(r'(?<=\d[wx]),\s*|,\s+')
 
 # Configuración de logging
 def setup_logging(date_str: str) -> None:
@@ -68,6 +126,66 @@ def setup_logging(date_str: str) -> None:
     logger.addHandler(file_handler)
     logger.addHandler(stream_handler)
 
+# Utilidades de parseo HTML (lexbor si está disponible, BeautifulSoup en caso contrario)
+def parse_html(html: str, strainer: Optional[SoupStrainer] = None) -> Any:
+    """Construye el árbol DOM del documento con el parser más rápido disponible.
+
+    Con BeautifulSoup, `strainer` limita las etiquetas que se materializan en el árbol.
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, BS4_FEATURES, parse_only=strainer)
+
+def select_all(node: Any, selector: str) -> List[Any]:
+    """Devuelve todos los nodos que coinciden con el selector CSS."""
+    if LexborHTMLParser is not None:
+        return node.css(selector)
+    return node.select(selector)
+
+def select_first(node: Any, selector: str) -> Optional[Any]:
+    """Devuelve el primer nodo que coincide con el selector CSS, o None."""
+    if LexborHTMLParser is not None:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+def select_first_of(node: Any, selectors: Tuple[str, ...]) -> Optional[Any]:
+    """Devuelve la coincidencia del primer selector, por orden de prioridad, que encuentre algo."""
+    for selector in selectors:
+        match = select_first(node, selector)
+        if match is not None:
+            return match
+    return None
+
+def node_text(node: Any) -> str:
+    """Devuelve el texto del nodo sin espacios sobrantes."""
+    if LexborHTMLParser is not None:
+        return node.text(strip=True)
+    return node.get_text(strip=True)
+
+def node_attr(node: Any, name: str, default: Optional[str] = None) -> Optional[str]:
+    """Devuelve el valor de un atributo del nodo, o el valor por defecto."""
+    if LexborHTMLParser is not None:
+        value = node.attributes.get(name)
+    else:
+        value = node.get(name)
+    return default if value is None else value
+
+def pick_srcset_url(srcset: str) -> Optional[str]:
+    """Devuelve la URL de mayor resolución de un srcset (descriptores `w` o `x`; 1x por defecto)."""
+    best_url, best_size = None, -1.0
+    for candidate in SRCSET_SPLIT_RE.split(srcset.strip()):
+        url, _, descriptor = candidate.strip().partition(' ')
+        if not url:
+            continue
+        descriptor = descriptor.strip()
+        try:
+            size = float(descriptor[:-1]) if descriptor else 1.0
+        except ValueError:
+            size = 1.0
+        if size > best_size:
+            best_url, best_size = url, size
+    return best_url
+
 @dataclass
 class NewsItem:
     """Clase para representar un artículo de noticias."""
@@ -83,50 +201,115 @@ class NewsItem:
         """Genera un ID único para la noticia basado en su título y enlace."""
         if not self.news_id:
             content = f"{self.title}|{self.link}".encode('utf-8')
-            self.news_id = hashlib.md5(content).hexdigest()
+            self.news_id = hashlib.blake2b(content, digest_size=8).hexdigest()
 
 class NewsHistory:
-    """Clase para gestionar el historial de noticias descargadas."""
+    """Clase para gestionar el historial de noticias descargadas.
+    
+    Los últimos `limit` IDs se guardan como enteros de 64 bits en un archivo binario. Los IDs MD5
+    del historial JSON antiguo se siguen comprobando aparte hasta que el historial nuevo se llena.
+    """
     
-    def __init__(self, history_file: Path = HISTORY_FILE, limit: int = CONFIG["history_limit"]):
+    def __init__(self, history_file: Path = HISTORY_FILE, limit: int = CONFIG["history_limit"],
+                 legacy_file: Path = LEGACY_HISTORY_FILE):
         """Inicializa el gestor de historial."""
         self.history_file = history_file
         self.limit = limit
+        self.legacy_file = legacy_file
+        # Solo se reescribe el archivo si el historial cambia
+        self._dirty = False
         self.news_ids = self._load_history()
+        self.legacy_ids = self._load_legacy_ids()
+    
+    @staticmethod
+    def _key(news_item: NewsItem) -> int:
+        """Convierte el ID hexadecimal de la noticia en un entero de 64 bits."""
+        return int(news_item.news_id[:16], 16)
+    
+    @staticmethod
+    def _legacy_key(news_item: NewsItem) -> str:
+        """Calcula el ID MD5 que usaba el historial JSON antiguo."""
+        return hashlib.md5(f"{news_item.title}|{news_item.link}".encode('utf-8')).hexdigest()
     
-    def _load_history(self) -> Set[str]:
-        """Carga el historial de noticias desde el archivo."""
-        if not self.history_file.exists():
+    def _load_history(self) -> Dict[int, None]:
+        """Carga el historial de noticias desde el archivo, conservando el orden de inserción."""
+        try:
+            if self.history_file.exists():
+                news_ids = array('Q')
+                news_ids.frombytes(self.history_file.read_bytes())
+                if sys.byteorder == 'big':
+                    news_ids.byteswap()
+                return dict.fromkeys(news_ids)
+            
+            # Migración desde el historial JSON: los IDs MD5 antiguos no caben en 64 bits y se
+            # comprueban aparte (ver _load_legacy_ids)
+            if self.legacy_file.exists():
+                with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                    history_data = json.load(f)
+                self._dirty = True
+                return dict.fromkeys(int(news_id, 16) for news_id in history_data.get("news_ids", [])
+                                     if len(news_id) == 16)
+        except Exception as e:
+            logger.error(f"Error al cargar el historial de noticias: {e}")
+        return {}
+    
+    def _load_legacy_ids(self) -> Set[str]:
+        """Carga los IDs MD5 del historial JSON antiguo mientras no hayan salido del historial."""
+        if len(self.news_ids) >= self.limit or not self.legacy_file.exists():
             return set()
         
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
                 history_data = json.load(f)
-                return set(history_data.get("news_ids", []))
+            return {news_id for news_id in history_data.get("news_ids", []) if len(news_id) == 32}
         except Exception as e:
-            logger.error(f"Error al cargar el historial de noticias: {e}")
+            logger.error(f"Error al cargar el historial de noticias antiguo: {e}")
             return set()
     
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Escribe en un archivo temporal y lo renombra, para no dejar el archivo truncado si falla."""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    
     def save_history(self) -> None:
-        """Guarda el historial de noticias en el archivo."""
+        """Guarda el historial de noticias en el archivo si ha cambiado."""
+        if not self._dirty:
+            logger.debug("El historial de noticias no ha cambiado, no se guarda")
+            return
+        
         try:
-            news_ids_list = list(self.news_ids)
-            if len(news_ids_list) > self.limit:
-                news_ids_list = news_ids_list[-self.limit:]
-                self.news_ids = set(news_ids_list)
+            if len(self.news_ids) > self.limit:
+                self.news_ids = dict.fromkeys(list(self.news_ids)[-self.limit:])
             
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump({"news_ids": list(self.news_ids)}, f, ensure_ascii=False, indent=2)
+            news_ids = array('Q', self.news_ids)
+            if sys.byteorder == 'big':
+                news_ids.byteswap()
+            self._write_atomic(self.history_file, news_ids.tobytes())
+            self._dirty = False
+            
+            # Con el historial nuevo lleno, los IDs antiguos ya habrían salido de él
+            if len(self.news_ids) >= self.limit and self.legacy_file.exists():
+                self.legacy_ids = set()
+                self.legacy_file.unlink()
+                logger.info("Historial JSON antiguo eliminado")
         except Exception as e:
             logger.error(f"Error al guardar el historial de noticias: {e}")
     
     def is_duplicate(self, news_item: NewsItem) -> bool:
         """Verifica si una noticia ya ha sido descargada."""
-        return news_item.news_id in self.news_ids
+        if self._key(news_item) in self.news_ids:
+            return True
+        return bool(self.legacy_ids) and self._legacy_key(news_item) in self.legacy_ids
     
     def add_item(self, news_item: NewsItem) -> None:
-        """Añade una noticia al historial."""
-        self.news_ids.add(news_item.news_id)
+        """Añade una noticia al historial (no hace nada si ya está en él)."""
+        news_id = self._key(news_item)
+        if news_id in self.news_ids:
+            return
+        self.news_ids[news_id] = None
+        self._dirty = True
 
 class GamingNewsScraper:
     """Clase para extraer noticias de videojuegos."""
@@ -135,6 +318,8 @@ class GamingNewsScraper:
         """Inicializa el scraper con la configuración proporcionada."""
         self.config = config or CONFIG
         self.session = self._create_session()
+        # Caché por instancia: evita repetir la descarga de una misma página durante la ejecución
+        self.get_page_text = lru_cache(maxsize=32)(self._fetch_page_text)
         self._ensure_output_dir()
         self.history = NewsHistory(limit=self.config["history_limit"])
     
@@ -142,13 +327,15 @@ class GamingNewsScraper:
     def _create_session() -> requests.Session:
         """Crea una sesión HTTP con reintentos automáticos."""
         session = requests.Session()
+        session.headers.update(BASE_HEADERS)
         retry_strategy = Retry(
             total=3,
             backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Todas las peticiones van al mismo host: se reutilizan las conexiones abiertas
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=16)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -163,22 +350,38 @@ class GamingNewsScraper:
         DEBUG_SUBDIR.mkdir(parents=True, exist_ok=True)
     
     def _get_random_headers(self) -> Dict[str, str]:
-        """Genera encabezados HTTP aleatorios para evitar detección."""
-        return {
-            'User-Agent': random.choice(USER_AGENTS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'es-ES,es;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Referer': 'https://www.google.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0'
-        }
+        """Genera un User-Agent aleatorio para evitar detección.
+        
+        El resto de encabezados (BASE_HEADERS) ya van fijados en las sesiones HTTP.
+        """
+        return {'User-Agent': random.choice(USER_AGENTS)}
+    
+    def _fetch_page_text(self, url: str) -> str:
+        """Descarga una página y devuelve su HTML (usar get_page_text, que la cachea)."""
+        response = self.session.get(
+            url,
+            headers=self._get_random_headers(),
+            timeout=self.config["request_timeout"]
+        )
+        response.raise_for_status()
+        return response.text
     
-    def fetch_gaming_news(self, page: int = 1) -> List[NewsItem]:
-        """Extrae las noticias de videojuegos del sitio web."""
-        news_list = []
+    def save_debug_html(self, filename: str, html: str) -> None:
+        """Guarda el HTML en el directorio de depuración si está activado o el log está en DEBUG."""
+        if not (self.config["debug_dump_html"] or logger.isEnabledFor(logging.DEBUG)):
+            return
         
+        debug_path = DEBUG_SUBDIR / filename
+        with open(debug_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        logger.debug(f"HTML guardado para depuración en {debug_path}")
+    
+    def fetch_gaming_news(self, page: int = 1, limit: Optional[int] = None) -> List[NewsItem]:
+        """Extrae las noticias de videojuegos del sitio web (como máximo `limit`)."""
+        return list(islice(self.iter_gaming_news(page), limit))
+    
+    def iter_gaming_news(self, page: int = 1) -> Iterator[NewsItem]:
+        """Extrae las noticias de una página bajo demanda: cada artículo se procesa al pedirlo."""
         try:
             if page > 1:
                 page_url = f"{NEWS_URL}/{page}"
@@ -187,19 +390,11 @@ class GamingNewsScraper:
                 
             logger.info(f"Obteniendo noticias desde {page_url}")
             
-            response = self.session.get(
-                page_url,
-                headers=self._get_random_headers(),
-                timeout=self.config["request_timeout"]
-            )
-            response.raise_for_status()
+            html = self.get_page_text(page_url)
             
-            debug_path = DEBUG_SUBDIR / f"debug_page_{page}.html"
-            with open(debug_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            logger.debug(f"HTML guardado para depuración en {debug_path}")
+            self.save_debug_html(f"debug_page_{page}.html", html)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = parse_html(html, LIST_STRAINER)
             
             selectors = [
                 'article.noticia', 'div.article', 'div.card', '.cardNoticia',
@@ -208,87 +403,66 @@ class GamingNewsScraper:
             
             articles = []
             for selector in selectors:
-                articles = soup.select(selector)
+                articles = select_all(tree, selector)
                 if articles:
                     logger.info(f"Selector exitoso: '{selector}'")
                     break
             
             if not articles:
-                titles = soup.select('h2 a, h1 a, h3 a')
+                titles = select_all(tree, 'h2 a, h1 a, h3 a')
                 if titles:
                     logger.info(f"Usando método alternativo, se encontraron {len(titles)} títulos")
                     for title_tag in titles:
-                        href = title_tag.get('href', '')
+                        href = node_attr(title_tag, 'href', '')
                         if 'noticia' in href.lower() and '/n.' in href.lower():
                             articles.append(title_tag.parent.parent)
             
             if not articles:
                 logger.warning(f"No se encontraron artículos en la página {page}")
-                return []
+                return
             
             logger.info(f"Se encontraron {len(articles)} artículos en la página {page}")
             
             for article in articles:
                 try:
-                    title_selectors = ['h2.titular a', 'h2 a', 'h1 a', 'h3 a', '.title a', 'a.title', 'a[title]']
-                    title_tag = None
-                    for selector in title_selectors:
-                        title_tag = article.select_one(selector)
-                        if title_tag:
-                            break
+                    title_tag = select_first_of(article, LIST_TITLE_SELECTORS)
                     
                     if not title_tag:
                         continue
                         
-                    title = title_tag.get_text(strip=True)
+                    title = node_text(title_tag)
                     
-                    summary_selectors = ['p.texto', 'p.description', '.summary', '.excerpt', 'p:not(.meta)', 'p']
-                    summary_tag = None
-                    for selector in summary_selectors:
-                        summary_tag = article.select_one(selector)
-                        if summary_tag:
-                            break
+                    summary_tag = select_first_of(article, LIST_SUMMARY_SELECTORS)
                     
-                    summary = summary_tag.get_text(strip=True) if summary_tag else 'Sin resumen disponible'
+                    summary = node_text(summary_tag) if summary_tag else 'Sin resumen disponible'
                     
-                    link = title_tag['href'] if 'href' in title_tag.attrs else ''
-                    if link and not link.startswith(('http://', 'https://')):
-                        link = f"{BASE_URL}{link}"
+                    link = node_attr(title_tag, 'href', '')
+                    if link:
+                        link = urljoin(page_url, link)
                     
-                    image_selectors = ['img', '.image img', '.thumbnail img', 'figure img']
-                    image_tag = None
-                    for selector in image_selectors:
-                        image_tag = article.select_one(selector)
-                        if image_tag:
-                            break
+                    image_tag = select_first_of(article, LIST_IMAGE_SELECTORS)
                     
                     image_url = None
                     if image_tag:
                         for attr in ['src', 'data-src', 'data-lazy-src', 'data-srcset']:
-                            if attr in image_tag.attrs:
-                                image_url = image_tag[attr].split(' ')[0] if ' ' in image_tag[attr] else image_tag[attr]
+                            value = node_attr(image_tag, attr)
+                            if value is not None:
+                                if attr == 'data-srcset':
+                                    image_url = pick_srcset_url(value)
+                                else:
+                                    image_url = value.strip().partition(' ')[0]
                                 break
                     
-                    if image_url and not image_url.startswith(('http://', 'https://')):
-                        image_url = f"{BASE_URL}{image_url}"
+                    if image_url:
+                        image_url = urljoin(page_url, image_url)
                     
-                    author_selectors = ['.autor', '.author', '.meta .author', 'span.author']
-                    author_tag = None
-                    for selector in author_selectors:
-                        author_tag = article.select_one(selector)
-                        if author_tag:
-                            break
+                    author_tag = select_first_of(article, LIST_AUTHOR_SELECTORS)
                     
-                    author = author_tag.get_text(strip=True) if author_tag else None
+                    author = node_text(author_tag) if author_tag else None
                     
-                    date_selectors = ['.fecha', '.date', '.meta .date', 'time', 'span.date']
-                    date_tag = None
-                    for selector in date_selectors:
-                        date_tag = article.select_one(selector)
-                        if date_tag:
-                            break
+                    date_tag = select_first_of(article, LIST_DATE_SELECTORS)
                     
-                    published_date = date_tag.get_text(strip=True) if date_tag else None
+                    published_date = node_text(date_tag) if date_tag else None
                     
                     if title and link:
                         news_item = NewsItem(
@@ -299,8 +473,8 @@ class GamingNewsScraper:
                             author=author,
                             published_date=published_date
                         )
-                        news_list.append(news_item)
                         logger.info(f"Noticia extraída: {title}")
+                        yield news_item
                 
                 except Exception as e:
                     logger.error(f"Error al procesar un artículo: {e}")
@@ -310,8 +484,6 @@ class GamingNewsScraper:
             logger.error(f"Error en la solicitud HTTP: {e}")
         except Exception as e:
             logger.error(f"Error inesperado: {e}")
-        
-        return news_list
     
     def fetch_article_details(self, news_item: NewsItem) -> NewsItem:
         """Obtiene detalles adicionales del artículo visitando su página."""
@@ -330,81 +502,100 @@ class GamingNewsScraper:
                 timeout=self.config["request_timeout"]
             )
             response.raise_for_status()
-            
-            debug_path = DEBUG_SUBDIR / f"debug_article_{news_item.news_id[:8]}.html"
-            with open(debug_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            summary_selectors = [
-                'div.entradilla', '.article-summary', '.summary', 
-                '.intro', '.excerpt', 'meta[name="description"]'
-            ]
-            
-            for selector in summary_selectors:
-                full_summary_tag = soup.select_one(selector)
-                if full_summary_tag:
-                    if selector == 'meta[name="description"]':
-                        news_item.summary = full_summary_tag.get('content', '')
-                    else:
-                        news_item.summary = full_summary_tag.get_text(strip=True)
-                    break
-            
-            if not news_item.image_url:
-                image_selectors = [
-                    'div.imagen img', '.article-featured-image img', 
-                    '.featured-image img', 'article img', '.content img', 
-                    'meta[property="og:image"]'
-                ]
-                
-                for selector in image_selectors:
-                    main_image = soup.select_one(selector)
-                    if main_image:
-                        if selector == 'meta[property="og:image"]':
-                            news_item.image_url = main_image.get('content', '')
-                        elif 'data-src' in main_image.attrs:
-                            news_item.image_url = main_image['data-src']
-                        elif 'src' in main_image.attrs:
-                            news_item.image_url = main_image['src']
-                        
-                        if news_item.image_url and not news_item.image_url.startswith(('http://', 'https://')):
-                            news_item.image_url = f"{BASE_URL}{news_item.image_url}"
-                        break
+            self._parse_article_details(news_item, response.text)
             
         except Exception as e:
             logger.error(f"Error al obtener detalles del artículo: {e}")
         
         return news_item
     
+    async def gather_details(self, news_items: List[NewsItem]) -> List[NewsItem]:
+        """Obtiene en paralelo los detalles de varias noticias, conservando su orden."""
+        return await self._run_in_threads(self.fetch_article_details, [(item,) for item in news_items])
+    
+    async def download_images(self, jobs: List[Tuple[NewsItem, Path]]) -> List[Optional[Path]]:
+        """Descarga en paralelo las imágenes de varias noticias desde el bucle de eventos."""
+        return await self._run_in_threads(self.download_image, jobs)
+    
+    async def _run_in_threads(self, func: Callable[..., Any], jobs: List[Tuple[Any, ...]]) -> List[Any]:
+        """Ejecuta func en hilos para cada tupla de argumentos, con la concurrencia limitada por CONFIG.
+        
+        Las peticiones siguen pasando por la sesión de requests y su estrategia de reintentos.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.config["max_concurrency"])
+        
+        async def run(*args: Any) -> Any:
+            async with semaphore:
+                return await loop.run_in_executor(None, func, *args)
+        
+        return await asyncio.gather(*(run(*args) for args in jobs))
+    
+    def _parse_article_details(self, news_item: NewsItem, html: str) -> None:
+        """Completa el resumen y la imagen de la noticia a partir del HTML de su página."""
+        self.save_debug_html(f"debug_article_{news_item.news_id[:8]}.html", html)
+        
+        tree = parse_html(html, ARTICLE_STRAINER)
+        
+        full_summary_tag = select_first_of(tree, ARTICLE_SUMMARY_SELECTORS)
+        if full_summary_tag:
+            news_item.summary = node_text(full_summary_tag)
+        else:
+            meta_description = select_first(tree, 'meta[name="description"]')
+            if meta_description:
+                news_item.summary = node_attr(meta_description, 'content', '')
+        
+        if not news_item.image_url:
+            main_image = select_first_of(tree, ARTICLE_IMAGE_SELECTORS)
+            if main_image:
+                news_item.image_url = node_attr(main_image, 'data-src') or node_attr(main_image, 'src')
+            else:
+                og_image = select_first(tree, 'meta[property="og:image"]')
+                if og_image:
+                    news_item.image_url = node_attr(og_image, 'content', '')
+            
+            if news_item.image_url:
+                news_item.image_url = urljoin(news_item.link, news_item.image_url)
+    
     def download_image(self, news_item: NewsItem, output_dir: Path) -> Optional[Path]:
         """Descarga la imagen de la noticia y la guarda en el directorio especificado."""
         if not news_item.image_url:
             logger.warning(f"No hay URL de imagen para la noticia: {news_item.title}")
             return None
         
+        image_ext = urlparse(news_item.image_url).path.rsplit('.', 1)[-1].lower()
+        if image_ext not in ['jpg', 'jpeg', 'png', 'gif']:
+            image_ext = 'jpg'
+        safe_title = SPACES_RE.sub('_', SLUG_RE.sub('', news_item.title))[:50]
+        image_filename = output_dir / f"image_{safe_title}.{image_ext}"
+        # Se descarga a un archivo temporal para no dejar una imagen a medias si falla la descarga
+        tmp_filename = image_filename.with_suffix(image_filename.suffix + '.part')
+        
         try:
-            response = self.session.get(
+            headers = self._get_random_headers()
+            headers['Accept-Encoding'] = 'identity'
+            # Se escribe la imagen por bloques en lugar de cargarla entera en memoria
+            with self.session.get(
                 news_item.image_url,
-                headers=self._get_random_headers(),
-                timeout=self.config["request_timeout"]
-            )
-            response.raise_for_status()
-            
-            image_ext = news_item.image_url.split('.')[-1].split('?')[0]
-            if image_ext.lower() not in ['jpg', 'jpeg', 'png', 'gif']:
-                image_ext = 'jpg'
-            safe_title = re.sub(r'[^\w\s-]', '', news_item.title).replace(' ', '_')[:50]
-            image_filename = output_dir / f"image_{safe_title}.{image_ext}"
-            
-            with open(image_filename, 'wb') as f:
-                f.write(response.content)
+                headers=headers,
+                timeout=self.config["request_timeout"],
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(tmp_filename, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+            os.replace(tmp_filename, image_filename)
             
             logger.info(f"Imagen descargada: {image_filename}")
             return image_filename
         
         except Exception as e:
             logger.error(f"Error al descargar la imagen para {news_item.title}: {e}")
+            try:
+                tmp_filename.unlink()
+            except FileNotFoundError:
+                pass
             return None
     
     def get_unique_news(self, count: int = None) -> Tuple[List[NewsItem], List[NewsItem]]:
@@ -418,22 +609,22 @@ class GamingNewsScraper:
         current_page = 1
         
         while len(new_news) < count and current_page <= max_pages:
-            all_news = self.fetch_gaming_news(page=current_page)
-            
-            if not all_news:
-                current_page += 1
-                continue
-            
-            for news_item in all_news:
-                if len(new_news) >= count:
-                    break
-                
+            found_news = False
+            # Se deja de procesar la página en cuanto se reúnen las noticias nuevas necesarias
+            for news_item in self.iter_gaming_news(page=current_page):
+                found_news = True
                 if self.history.is_duplicate(news_item):
                     duplicate_news.append(news_item)
                     logger.info(f"Noticia duplicada: {news_item.title}")
                 else:
                     new_news.append(news_item)
                     logger.info(f"Nueva noticia encontrada: {news_item.title}")
+                    if len(new_news) >= count:
+                        break
+            
+            if not found_news:
+                current_page += 1
+                continue
             
             if len(new_news) < count:
                 current_page += 1
@@ -484,38 +675,46 @@ class ContentGenerator:
         
         # Guardar las noticias en formato JSON
         news_filename = date_dir / "news.json"
-        with open(news_filename, 'w', encoding='utf-8') as f:
-            json.dump([asdict(item) for item in news_items], f, ensure_ascii=False, indent=2)
+        news_data = [asdict(item) for item in news_items]
+        if orjson is not None:
+            news_filename.write_bytes(orjson.dumps(news_data, option=orjson.OPT_INDENT_2))
+        else:
+            news_filename.write_bytes(json.dumps(news_data, ensure_ascii=False, indent=2).encode('utf-8'))
         logger.info(f"Noticias guardadas en {news_filename}")
         
-        # Guardar cada noticia en su propia subcarpeta
-        for i, (news_item, caption) in enumerate(zip(news_items, captions)):
-            news_dir = date_dir / f"noticia_{i+1}"
-            news_dir.mkdir(parents=True, exist_ok=True)
-            
+        # Crear todas las subcarpetas de noticias de una vez
+        news_dirs = [date_dir / f"noticia_{i+1}" for i in range(min(len(news_items), len(captions)))]
+        for news_dir in news_dirs:
+            news_dir.mkdir(exist_ok=True)
+        
+        # Guardar cada noticia en su propia subcarpeta (un único write por archivo)
+        image_jobs = []
+        for news_item, caption, news_dir in zip(news_items, captions, news_dirs):
             # Guardar caption
             caption_filename = news_dir / "caption.txt"
-            with open(caption_filename, 'w', encoding='utf-8') as f:
-                f.write(caption)
+            caption_filename.write_text(caption, encoding='utf-8')
             logger.info(f"Caption guardado en {caption_filename}")
             
             # Guardar título y descripción
             description_filename = news_dir / "description.txt"
-            with open(description_filename, 'w', encoding='utf-8') as f:
-                f.write(f"Título: {news_item.title}\n\n")
-                f.write(f"Descripción: {self.format_description(news_item)}")
+            description_filename.write_text(
+                f"Título: {news_item.title}\n\nDescripción: {self.format_description(news_item)}",
+                encoding='utf-8'
+            )
             logger.info(f"Título y descripción guardados en {description_filename}")
             
-            # Descargar y guardar imagen
-            image_path = scraper.download_image(news_item, news_dir)
+            image_jobs.append((news_item, news_dir))
+        
+        # Descargar y guardar imágenes en paralelo
+        image_paths = asyncio.run(scraper.download_images(image_jobs))
+        for i, image_path in enumerate(image_paths):
             if image_path:
                 logger.info(f"Imagen para noticia {i+1} guardada en {image_path}")
         
         # Guardar todos los captions en un solo archivo
         all_captions_filename = date_dir / "all_captions.txt"
-        with open(all_captions_filename, 'w', encoding='utf-8') as f:
-            for i, caption in enumerate(captions):
-                f.write(f"=== CAPTION {i+1} ===\n{caption}\n\n")
+        all_captions = "".join(f"=== CAPTION {i+1} ===\n{caption}\n\n" for i, caption in enumerate(captions))
+        all_captions_filename.write_text(all_captions, encoding='utf-8')
         
         logger.info(f"Todos los pies de foto guardados en {all_captions_filename}")
         return str(all_captions_filename), date_dir
@@ -542,37 +741,28 @@ def main():
             fallback_news = []
             try:
                 logger.info("Intentando método de respaldo...")
-                response = requests.get(
-                    "https://vandal.elespanol.com",
-                    headers={'User-Agent': random.choice(USER_AGENTS)},
-                    timeout=CONFIG["request_timeout"]
-                )
-                if response.status_code == 200:
-                    debug_path = DEBUG_SUBDIR / "debug_homepage.html"
-                    with open(debug_path, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    all_links = soup.find_all('a')
-                    news_links = []
-                    for link in all_links:
-                        href = link.get('href', '')
-                        if '/noticia/' in href or '/noticias/' in href:
-                            title = link.get_text(strip=True)
-                            if title and len(title) > 15:
-                                news_links.append((title, href))
-                    
-                    news_links = list(set(news_links))
-                    logger.info(f"Método de respaldo encontró {len(news_links)} posibles noticias")
-                    
-                    for i, (title, href) in enumerate(news_links[:CONFIG["news_count"]]):
-                        if not href.startswith('http'):
-                            href = f"{BASE_URL}{href}"
-                        fallback_news.append(NewsItem(
-                            title=title,
-                            summary="",
-                            link=href
-                        ))
+                html = scraper.get_page_text(BASE_URL)
+                scraper.save_debug_html("debug_homepage.html", html)
+                
+                tree = parse_html(html, HOMEPAGE_STRAINER)
+                # Un enlace por URL, en el orden en que aparecen en la portada
+                news_links = {}
+                for link in select_all(tree, HOMEPAGE_NEWS_LINK_SELECTOR):
+                    href = urljoin(BASE_URL, node_attr(link, 'href', ''))
+                    if href in news_links:
+                        continue
+                    title = node_text(link)
+                    if title and len(title) > 15:
+                        news_links[href] = title
+                
+                logger.info(f"Método de respaldo encontró {len(news_links)} posibles noticias")
+                
+                for href, title in list(news_links.items())[:CONFIG["news_count"]]:
+                    fallback_news.append(NewsItem(
+                        title=title,
+                        summary="",
+                        link=href
+                    ))
             except Exception as e:
                 logger.error(f"Error en el método de respaldo: {e}")
             
@@ -580,21 +770,17 @@ def main():
                 new_news = fallback_news
                 logger.info(f"Método de respaldo encontró {len(new_news)} noticias")
             else:
-                all_news = scraper.fetch_gaming_news()
-                if not all_news:
+                new_news = scraper.fetch_gaming_news(limit=CONFIG["news_count"])
+                if not new_news:
                     logger.error("No se pudo obtener ninguna noticia. Finalizando.")
                     return 1
-                new_news = all_news[:CONFIG["news_count"]]
                 logger.info(f"Se utilizarán {len(new_news)} noticias aunque sean duplicadas.")
         else:
             logger.info(f"Se obtuvieron {len(new_news)} noticias nuevas")
         
-        detailed_news = []
-        for item in new_news:
-            detailed_item = scraper.fetch_article_details(item)
-            detailed_news.append(detailed_item)
-            if not scraper.history.is_duplicate(detailed_item):
-                scraper.history.add_item(detailed_item)
+        detailed_news = asyncio.run(scraper.gather_details(new_news))
+        for detailed_item in detailed_news:
+            scraper.history.add_item(detailed_item)
         
         scraper.history.save_history()
         